@@ -1,10 +1,13 @@
+import argparse
 import asyncio
+import random
 import subprocess
 import requests
 import time
+from pathlib import Path
 from typing import Optional
 from src.pipeline.utils import load_config, ensure_data_dirs, setup_logger
-from src.pipeline import DataPipelineScheduler
+from src.pipeline import DataPipelineScheduler, CheckpointStore, SamplingProfiler
 from src.pipeline.tasks import create_pipeline_tasks
 
 logger = setup_logger(__name__)
@@ -35,25 +38,73 @@ def start_service(cmd: list[str]) -> Optional[subprocess.Popen]:
         logger.error(f"Failed to start service {cmd}: {e}")
         return None
 
-async def run_pipeline():
-    """Run the data pipeline."""
+async def run_pipeline(resume_run_id: Optional[str] = None, profile: bool = False):
+    """Run the data pipeline, optionally resuming a checkpointed run."""
     config = load_config()
     ensure_data_dirs(config)
     
-    scheduler = DataPipelineScheduler(config)
+    checkpoint_dir = config['pipeline'].get('checkpoint_dir', 'data/checkpoints')
+    if resume_run_id:
+        checkpoint = CheckpointStore.open(checkpoint_dir, resume_run_id)
+        logger.info(f"Resuming pipeline run {resume_run_id}")
+    else:
+        checkpoint = CheckpointStore.create(checkpoint_dir)
+        logger.info(f"Starting pipeline run {checkpoint.run_id}")
+    
+    # Profile on request, or for a configured fraction of runs
+    profiling = config.get('profiling', {})
+    if not profile and random.random() < profiling.get('sample_rate', 0.0):
+        profile = True
+    profiler = None
+    if profile:
+        profiler = SamplingProfiler(
+            interval=profiling.get('interval_ms', 10) / 1000,
+            symbol=config['data']['symbol']
+        )
+    
+    scheduler = DataPipelineScheduler(config, checkpoint=checkpoint, profiler=profiler)
     tasks = create_pipeline_tasks(config)
     
     for task in tasks:
         scheduler.add_task(task)
     
-    return await scheduler.run()
+    if profiler:
+        profiler.start()
+    try:
+        results = await scheduler.run()
+    finally:
+        if profiler:
+            profiler.stop()
+            profile_dir = Path(profiling.get('output_dir', 'data/profiles')) / checkpoint.run_id
+            profiler.write(profile_dir, top_n=profiling.get('top_n', 20))
+    
+    if scheduler.failed_tasks:
+        raise RuntimeError(
+            f"Pipeline run {checkpoint.run_id} had failed tasks: "
+            f"{', '.join(scheduler.failed_tasks)}"
+        )
+    return results
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Market analysis pipeline and services")
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume a checkpointed pipeline run, re-running only incomplete or failed tasks"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Sample task stacks and write flame graph data and a hot-function report"
+    )
+    return parser.parse_args()
 
-async def main():
+async def main(resume_run_id: Optional[str] = None, profile: bool = False):
     """Run the entire system with proper service orchestration."""
     try:
         # Run the pipeline first
         logger.info("Starting data pipeline...")
-        await run_pipeline()
+        await run_pipeline(resume_run_id, profile)
         logger.info("Pipeline completed successfully")
         
         # Start the API server
@@ -89,4 +140,5 @@ async def main():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    args = parse_args()
+    asyncio.run(main(args.resume, args.profile))
\ No newline at end of file
@@ -7,6 +7,7 @@ from datetime import datetime
 from pathlib import Path
 import logging
 import yaml
+from src.pipeline.dataplane import DataPlaneReader
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -37,6 +38,20 @@ def load_config():
 config = load_config()
 PROCESSED_DATA_DIR = Path(config['data']['processed_dir'])
 
+# Memory-mapped arrays published by the pipeline, shared across workers
+dataplane = DataPlaneReader(PROCESSED_DATA_DIR / 'dataplane')
+
+HISTORICAL_COLUMNS = {
+    "close": "Close",
+    "volume": "Volume",
+    "sma_50": "SMA_50",
+    "sma_200": "SMA_200",
+    "rsi": "RSI",
+    "macd": "MACD",
+    "signal_line": "Signal_Line",
+    "market_regime": "Market_Regime"
+}
+
 @app.get("/")
 async def root():
     return {"message": "SPY Analysis API"}
@@ -53,6 +68,16 @@ async def get_latest_metrics():
 @app.get("/data/historical")
 async def get_historical_data(days: Optional[int] = 252):
     try:
+        frame = dataplane.snapshot()
+        if frame is not None and len(frame):
+            if days:
+                frame = frame.tail(days)
+            data = {"dates": pd.DatetimeIndex(frame.index).astype(str).tolist()}
+            for key, column in HISTORICAL_COLUMNS.items():
+                data[key] = frame.columns[column].tolist()
+            return data
+        
+        # Fall back to the CSV if the pipeline has not published to the data plane
         csv_path = PROCESSED_DATA_DIR / 'spy_analysis.csv'
         logger.info(f"Reading CSV from: {csv_path.absolute()}")
         
@@ -78,17 +103,9 @@ async def get_historical_data(days: Optional[int] = 252):
         if days:
             df = df.tail(days)
             
-        data = {
-            "dates": df.index.astype(str).tolist(),
-            "close": df['Close'].tolist(),
-            "volume": df['Volume'].tolist(),
-            "sma_50": df['SMA_50'].tolist(),
-            "sma_200": df['SMA_200'].tolist(),
-            "rsi": df['RSI'].tolist(),
-            "macd": df['MACD'].tolist(),
-            "signal_line": df['Signal_Line'].tolist(),
-            "market_regime": df['Market_Regime'].tolist()
-        }
+        data = {"dates": df.index.astype(str).tolist()}
+        for key, column in HISTORICAL_COLUMNS.items():
+            data[key] = df[column].tolist()
         
         if not data['dates']:
             logger.error("No dates found in processed data")
@@ -1,3 +1,9 @@
 from .scheduler import DataPipelineScheduler, PipelineTask, Priority
+from .alerts import AlertEngine, AlertRule
+from .checkpoint import CheckpointStore, TaskStatus
+from .dataplane import DataPlaneReader, publish_frame
+from .profiler import SamplingProfiler
 
-__all__ = ['DataPipelineScheduler', 'PipelineTask', 'Priority']
\ No newline at end of file
+__all__ = ['DataPipelineScheduler', 'PipelineTask', 'Priority', 'AlertEngine', 'AlertRule',
+           'CheckpointStore', 'TaskStatus', 'DataPlaneReader', 'publish_frame',
+           'SamplingProfiler']
\ No newline at end of file
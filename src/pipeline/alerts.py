@@ -0,0 +1,266 @@
+from dataclasses import dataclass, asdict
+from enum import Enum
+import json
+import logging
+import numpy as np
+import pandas as pd
+import requests
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable
+from .utils import get_data_path
+
+class Direction(Enum):
+    ABOVE = 1
+    BELOW = -1
+
+@dataclass
+class AlertRule:
+    """A crossing rule on an indicator column.
+
+    Fires when ``column - reference - value`` changes sign between two
+    consecutive bars of the same symbol. ``reference`` is another column
+    (e.g. SMA_200 for a golden cross) or None to compare against ``value``.
+    """
+    name: str
+    column: str
+    crosses: Direction
+    value: float = 0.0
+    reference: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, rule: Dict[str, Any]) -> 'AlertRule':
+        return cls(
+            name=rule['name'],
+            column=rule['column'],
+            crosses=Direction[str(rule['crosses']).upper()],
+            value=float(rule.get('value', 0.0)),
+            reference=rule.get('reference')
+        )
+
+@dataclass
+class Alert:
+    rule: str
+    symbol: str
+    timestamp: str
+    column: str
+    value: float
+    threshold: float
+    crosses: str
+
+class AlertSink:
+    """Destination for fired alerts."""
+
+    def emit(self, alerts: List[Alert]) -> None:
+        raise NotImplementedError
+
+class LogSink(AlertSink):
+    def __init__(self, level: int = logging.WARNING):
+        self.logger = logging.getLogger(__name__)
+        self.level = level
+
+    def emit(self, alerts: List[Alert]) -> None:
+        for alert in alerts:
+            self.logger.log(
+                self.level,
+                f"[{alert.rule}] {alert.symbol} {alert.column} crossed {alert.crosses} "
+                f"{alert.threshold:.4f} at {alert.timestamp} (value={alert.value:.4f})"
+            )
+
+class FileSink(AlertSink):
+    """Append alerts to a JSON lines file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def emit(self, alerts: List[Alert]) -> None:
+        if not alerts:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a') as f:
+            for alert in alerts:
+                f.write(json.dumps(asdict(alert), default=str) + '\n')
+
+class WebhookSink(AlertSink):
+    """POST alerts as a JSON batch. Delivery failures are logged, not raised."""
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    def emit(self, alerts: List[Alert]) -> None:
+        if not alerts:
+            return
+        payload = {'alerts': [asdict(alert) for alert in alerts]}
+        try:
+            requests.post(self.url, json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to deliver {len(alerts)} alerts to {self.url}: {str(e)}")
+
+def build_sinks(config: Dict[str, Any]) -> List[AlertSink]:
+    """Create alert sinks from the ``alerts.sinks`` config section."""
+    sinks: List[AlertSink] = []
+    for sink in config.get('alerts', {}).get('sinks', [{'type': 'log'}]):
+        kind = sink['type']
+        if kind == 'log':
+            sinks.append(LogSink())
+        elif kind == 'file':
+            sinks.append(FileSink(get_data_path(config, sink.get('path', 'alerts.jsonl'))))
+        elif kind == 'webhook':
+            sinks.append(WebhookSink(sink['url'], timeout=sink.get('timeout', 5.0)))
+        else:
+            raise ValueError(f"Unknown alert sink type: {kind}")
+    return sinks
+
+class AlertEngine:
+    """Evaluate a compiled rule set against newly appended bars.
+
+    Rules are compiled once into column-index and threshold arrays, so each
+    bar is evaluated as a single (symbols x rules) array operation. The
+    engine only keeps the previous bar's signal per symbol and rule, so
+    evaluation never touches history.
+    """
+
+    def __init__(self, rules: Iterable[AlertRule], sinks: Optional[List[AlertSink]] = None):
+        self.rules = list(rules)
+        self.sinks = sinks if sinks is not None else [LogSink()]
+        self.logger = logging.getLogger(__name__)
+
+        names = [rule.name for rule in self.rules]
+        if len(names) != len(set(names)):
+            raise ValueError("Alert rule names must be unique")
+
+        # Compile: every rule reads two columns of the bar matrix. Rules
+        # without a reference column read a trailing column of zeros.
+        self.columns = sorted(
+            {rule.column for rule in self.rules}
+            | {rule.reference for rule in self.rules if rule.reference}
+        )
+        col_idx = {col: i for i, col in enumerate(self.columns)}
+        zero_col = len(self.columns)
+        self._left = np.array([col_idx[r.column] for r in self.rules], dtype=np.intp)
+        self._right = np.array(
+            [col_idx[r.reference] if r.reference else zero_col for r in self.rules],
+            dtype=np.intp
+        )
+        self._threshold = np.array([r.value for r in self.rules], dtype=np.float64)
+        self._direction = np.array([r.crosses.value for r in self.rules], dtype=np.int8)
+        self._names = names
+        self._columns = [r.column for r in self.rules]
+        self._crosses = [r.crosses.name.lower() for r in self.rules]
+
+        self._symbols = pd.Index([], dtype=object)
+        self._prev = np.empty((0, len(self.rules)), dtype=np.float64)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'AlertEngine':
+        rules = [AlertRule.from_config(r) for r in config.get('alerts', {}).get('rules', [])]
+        return cls(rules, build_sinks(config))
+
+    def _values(self, bars: pd.DataFrame) -> np.ndarray:
+        values = bars.reindex(columns=self.columns).to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.hstack([values, np.zeros((len(values), 1))])
+
+    def _signal(self, values: np.ndarray) -> np.ndarray:
+        return values[:, self._left] - values[:, self._right] - self._threshold
+
+    def _rows_for(self, symbols: pd.Index) -> np.ndarray:
+        rows = self._symbols.get_indexer(symbols)
+        unseen = rows == -1
+        if unseen.any():
+            new_symbols = symbols[unseen]
+            rows[unseen] = np.arange(len(self._symbols), len(self._symbols) + len(new_symbols))
+            self._symbols = self._symbols.append(new_symbols)
+            self._prev = np.vstack([
+                self._prev,
+                np.full((len(new_symbols), len(self.rules)), np.nan)
+            ])
+        return rows
+
+    def prime(self, bars: pd.DataFrame) -> None:
+        """Record ``bars`` (indexed by symbol) as the previous bar without firing."""
+        rows = self._rows_for(pd.Index(bars.index))
+        self._prev[rows] = self._signal(self._values(bars))
+
+    def evaluate(self, bars: pd.DataFrame, timestamp: Any = None) -> List[Alert]:
+        """Evaluate one new bar per symbol and push fired alerts to the sinks.
+
+        ``bars`` is indexed by symbol with indicator columns. Symbols seen
+        for the first time are primed and cannot fire on this bar.
+        """
+        if bars.empty or not self.rules:
+            return []
+        if bars.index.has_duplicates:
+            raise ValueError("Expected at most one bar per symbol")
+
+        symbols = pd.Index(bars.index)
+        rows = self._rows_for(symbols)
+        values = self._values(bars)
+        cur = self._signal(values)
+        prev = self._prev[rows]
+
+        # NaN comparisons are False, so warm-up bars never fire
+        with np.errstate(invalid='ignore'):
+            up = (prev <= 0) & (cur > 0)
+            down = (prev >= 0) & (cur < 0)
+        fired = np.where(self._direction == Direction.ABOVE.value, up, down)
+
+        # Keep the last known signal when a bar is missing an indicator
+        self._prev[rows] = np.where(np.isnan(cur), prev, cur)
+
+        sym_pos, rule_pos = np.nonzero(fired)
+        if len(sym_pos) == 0:
+            return []
+
+        ts = str(timestamp) if timestamp is not None else pd.Timestamp.now().isoformat()
+        values_hit = values[sym_pos, self._left[rule_pos]]
+        threshold_hit = values_hit - cur[sym_pos, rule_pos]
+        alerts = [
+            Alert(
+                rule=self._names[r],
+                symbol=symbol,
+                timestamp=ts,
+                column=self._columns[r],
+                value=value,
+                threshold=threshold,
+                crosses=self._crosses[r]
+            )
+            for r, symbol, value, threshold in zip(
+                rule_pos.tolist(),
+                symbols.to_numpy(dtype=object)[sym_pos].astype(str).tolist(),
+                values_hit.tolist(),
+                threshold_hit.tolist()
+            )
+        ]
+
+        for sink in self.sinks:
+            try:
+                sink.emit(alerts)
+            except Exception as e:
+                self.logger.error(f"Alert sink {type(sink).__name__} failed: {str(e)}")
+        return alerts
+
+    def _fingerprint(self) -> List[List[Any]]:
+        return [
+            [r.name, r.column, r.reference, r.value, r.crosses.name] for r in self.rules
+        ]
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Serializable engine state for resuming on the next run."""
+        return {
+            'rules': self._fingerprint(),
+            'symbols': [str(s) for s in self._symbols],
+            'prev': [[None if np.isnan(v) else float(v) for v in row] for row in self._prev]
+        }
+
+    def load_state(self, state: Dict[str, Any]) -> bool:
+        """Restore state saved by ``state_dict``. Returns False if the rules changed."""
+        if state.get('rules') != self._fingerprint():
+            self.logger.info("Alert rules changed since last run, discarding saved state")
+            return False
+        self._symbols = pd.Index(state['symbols'], dtype=object)
+        self._prev = np.array(
+            [[np.nan if v is None else v for v in row] for row in state['prev']],
+            dtype=np.float64
+        ).reshape(len(self._symbols), len(self.rules))
+        return True
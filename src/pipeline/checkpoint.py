@@ -0,0 +1,88 @@
+from enum import Enum
+import json
+import os
+import pickle
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+class TaskStatus(Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    UPSTREAM_FAILED = "upstream_failed"
+
+def new_run_id() -> str:
+    """Generate a sortable run ID from the current time."""
+    return datetime.now().strftime('%Y%m%dT%H%M%S%f')
+
+class CheckpointStore:
+    """Persist task outputs and statuses for a single pipeline run.
+
+    Layout under ``<base_dir>/<run_id>/``:
+        manifest.json      task name -> status, timestamps, error
+        <task>.pkl         pickled output of each completed task
+    """
+
+    def __init__(self, base_dir: Path, run_id: str):
+        self.run_id = run_id
+        self.run_dir = Path(base_dir) / run_id
+        self.manifest_path = self.run_dir / 'manifest.json'
+        self.logger = logging.getLogger(__name__)
+        self.manifest: Dict[str, Any] = {'run_id': run_id, 'tasks': {}}
+
+    @classmethod
+    def create(cls, base_dir: Path, run_id: Optional[str] = None) -> 'CheckpointStore':
+        store = cls(base_dir, run_id or new_run_id())
+        store.run_dir.mkdir(parents=True, exist_ok=True)
+        store._write_manifest()
+        return store
+
+    @classmethod
+    def open(cls, base_dir: Path, run_id: str) -> 'CheckpointStore':
+        store = cls(base_dir, run_id)
+        if not store.manifest_path.exists():
+            raise FileNotFoundError(f"No checkpoint found for run {run_id} in {base_dir}")
+        with open(store.manifest_path) as f:
+            store.manifest = json.load(f)
+        return store
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self) -> None:
+        self._atomic_write(
+            self.manifest_path,
+            json.dumps(self.manifest, indent=4, default=str).encode()
+        )
+
+    def _set_status(self, task_name: str, status: TaskStatus, **extra: Any) -> None:
+        self.manifest['tasks'][task_name] = {
+            'status': status.value,
+            'updated_at': datetime.now().isoformat(),
+            **extra
+        }
+        self._write_manifest()
+
+    def status(self, task_name: str) -> TaskStatus:
+        entry = self.manifest['tasks'].get(task_name)
+        return TaskStatus(entry['status']) if entry else TaskStatus.PENDING
+
+    def save_result(self, task_name: str, result: Any) -> None:
+        """Persist a task's output, then mark it completed."""
+        self._atomic_write(self.run_dir / f'{task_name}.pkl', pickle.dumps(result))
+        self._set_status(task_name, TaskStatus.COMPLETED)
+
+    def load_result(self, task_name: str) -> Any:
+        with open(self.run_dir / f'{task_name}.pkl', 'rb') as f:
+            return pickle.load(f)
+
+    def mark_failed(self, task_name: str, error: str) -> None:
+        self._set_status(task_name, TaskStatus.FAILED, error=error)
+
+    def mark_upstream_failed(self, task_name: str, failed_dependency: str) -> None:
+        self._set_status(task_name, TaskStatus.UPSTREAM_FAILED, failed_dependency=failed_dependency)
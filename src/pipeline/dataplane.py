@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+import json
+import os
+import shutil
+import time
+import logging
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+
+logger = logging.getLogger(__name__)
+
+def publish_frame(df: pd.DataFrame, base_dir: Path, keep: int = 2) -> str:
+    """Publish a frame as one ``.npy`` buffer per column and return its version.
+
+    Each publish goes to a new version directory, and the ``CURRENT`` pointer
+    is swapped atomically once all buffers are written, so readers never see
+    a partial publish. Object columns are stored as fixed-width unicode so
+    every column can be memory-mapped.
+    """
+    base_dir = Path(base_dir)
+    base_dir.mkdir(parents=True, exist_ok=True)
+    version = str(time.time_ns())
+    tmp_dir = base_dir / f'.{version}.tmp'
+    tmp_dir.mkdir()
+
+    manifest = {'version': version, 'rows': len(df), 'columns': {}}
+    np.save(tmp_dir / 'index.npy', np.asarray(df.index.values))
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype == object:
+            values = values.astype(str)
+        filename = f'col_{i}.npy'
+        np.save(tmp_dir / filename, values)
+        manifest['columns'][str(column)] = filename
+
+    with open(tmp_dir / MANIFEST_FILE, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp_dir, base_dir / version)
+
+    pointer_tmp = base_dir / f'{CURRENT_FILE}.tmp'
+    pointer_tmp.write_text(version)
+    os.replace(pointer_tmp, base_dir / CURRENT_FILE)
+
+    # Old versions stay on disk for a while so readers mid-swap can finish;
+    # on POSIX, already-mapped buffers also survive the unlink.
+    versions = sorted(p for p in base_dir.iterdir() if p.is_dir() and not p.name.startswith('.'))
+    for stale in versions[:-keep]:
+        shutil.rmtree(stale, ignore_errors=True)
+
+    logger.info(f"Published {len(df)} rows to data plane version {version}")
+    return version
+
+@dataclass
+class MappedFrame:
+    """Read-only column arrays backed by memory-mapped buffers."""
+    version: str
+    index: np.ndarray
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def tail(self, n: int) -> 'MappedFrame':
+        """Last ``n`` rows as views; nothing is copied."""
+        start = max(len(self) - n, 0)
+        return MappedFrame(
+            version=self.version,
+            index=self.index[start:],
+            columns={name: values[start:] for name, values in self.columns.items()}
+        )
+
+class DataPlaneReader:
+    """Map the latest published frame, re-mapping only when the version changes.
+
+    Buffers are opened with ``mmap_mode='r'``, so every worker process shares
+    the same page cache pages instead of holding its own parsed copy.
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = Path(base_dir)
+        self._frame: Optional[MappedFrame] = None
+
+    def _current_version(self) -> Optional[str]:
+        try:
+            return (self.base_dir / CURRENT_FILE).read_text().strip()
+        except FileNotFoundError:
+            return None
+
+    def _map(self, version: str) -> MappedFrame:
+        version_dir = self.base_dir / version
+        with open(version_dir / MANIFEST_FILE) as f:
+            manifest = json.load(f)
+        return MappedFrame(
+            version=version,
+            index=np.load(version_dir / 'index.npy', mmap_mode='r'),
+            columns={
+                name: np.load(version_dir / filename, mmap_mode='r')
+                for name, filename in manifest['columns'].items()
+            }
+        )
+
+    def snapshot(self) -> Optional[MappedFrame]:
+        """Return the latest published frame, or None if nothing is published."""
+        version = self._current_version()
+        if version is None:
+            return self._frame
+        if self._frame is None or self._frame.version != version:
+            try:
+                self._frame = self._map(version)
+            except (FileNotFoundError, ValueError) as e:
+                # Pruned or mid-publish; keep serving the previous mapping
+                logger.warning(f"Could not map data plane version {version}: {str(e)}")
+        return self._frame
@@ -0,0 +1,196 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from types import CodeType
+import concurrent.futures.thread as _executor_thread
+import json
+import sys
+import threading
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+FrameKey = Tuple[str, str, int]
+
+_EXECUTOR_FILE = _executor_thread.__file__
+
+def _frame_key(code: CodeType) -> FrameKey:
+    return (getattr(code, 'co_qualname', code.co_name), code.co_filename, code.co_firstlineno)
+
+def _frame_label(key: FrameKey) -> str:
+    name, filename, line = key
+    return f"{name} ({Path(filename).name}:{line})"
+
+class SamplingProfiler:
+    """Stack sampler that attributes samples to the running pipeline tasks.
+
+    A daemon thread snapshots every thread's stack with ``sys._current_frames``
+    once per interval, so the profiled code runs unmodified and the overhead
+    is bounded by the sampling rate rather than the number of calls.
+
+    A stack is attributed to a task when the task's function is on it. Stacks
+    inside an ``asyncio.to_thread`` worker are attributed to the single active
+    task, if there is exactly one; anything else is dropped.
+    """
+
+    def __init__(self, interval: float = 0.01, symbol: Optional[str] = None):
+        self.interval = interval
+        self.symbol = symbol or 'pipeline'
+        self.samples: Dict[str, Counter] = defaultdict(Counter)
+        self._active: Dict[str, Optional[CodeType]] = {}
+        self._task_codes: Dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='pipeline-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def task(self, name: str, function: Callable):
+        """Mark ``name`` as running for the duration of the block."""
+        code = getattr(function, '__code__', None)
+        with self._lock:
+            self._active[name] = code
+            if code is not None:
+                self._task_codes[code] = name
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active.pop(name, None)
+                if code is not None:
+                    self._task_codes.pop(code, None)
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                if not self._active:
+                    continue
+                task_codes = dict(self._task_codes)
+                active = list(self._active)
+
+            for ident, frame in sys._current_frames().items():
+                if ident != own_ident:
+                    self._record(frame, task_codes, active)
+
+    def _record(self, frame, task_codes: Dict[CodeType, str], active: List[str]):
+        stack = []
+        task_name = None
+        in_worker = False
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == 'run' and code.co_filename == _EXECUTOR_FILE:
+                in_worker = True
+                break
+            stack.append(code)
+            if code in task_codes:
+                task_name = task_codes[code]
+                break
+            frame = frame.f_back
+
+        if task_name is None:
+            if not (in_worker and len(active) == 1):
+                return
+            task_name = active[0]
+        self.samples[task_name][tuple(reversed(stack))] += 1
+
+    def _keyed_stacks(self, task_name: str) -> Counter:
+        stacks: Counter = Counter()
+        for codes, count in self.samples[task_name].items():
+            stacks[tuple(_frame_key(code) for code in codes)] += count
+        return stacks
+
+    def collapsed(self, task_name: str) -> List[str]:
+        """Folded stacks (``frame;frame;... count``) rooted at symbol and task."""
+        return [
+            ';'.join([self.symbol, task_name] + [_frame_label(key) for key in stack]) + f' {count}'
+            for stack, count in self._keyed_stacks(task_name).most_common()
+        ]
+
+    def hot_functions(self, task_name: str, top_n: int = 20) -> List[Tuple[str, int, int]]:
+        """Top functions by self samples, as (label, self, inclusive)."""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self._keyed_stacks(task_name).items():
+            if not stack:
+                continue
+            self_counts[stack[-1]] += count
+            for key in set(stack):
+                total_counts[key] += count
+        return [
+            (_frame_label(key), count, total_counts[key])
+            for key, count in self_counts.most_common(top_n)
+        ]
+
+    def speedscope(self) -> Dict:
+        """All tasks as one speedscope file with a sampled profile per task."""
+        frames: List[Dict] = []
+        frame_index: Dict[FrameKey, int] = {}
+        profiles = []
+        for task_name in self.samples:
+            samples, weights = [], []
+            for stack, count in self._keyed_stacks(task_name).items():
+                indices = []
+                for key in stack:
+                    if key not in frame_index:
+                        frame_index[key] = len(frames)
+                        frames.append({'name': key[0], 'file': key[1], 'line': key[2]})
+                    indices.append(frame_index[key])
+                samples.append(indices)
+                weights.append(count * self.interval)
+            profiles.append({
+                'type': 'sampled',
+                'name': f'{self.symbol}/{task_name}',
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights
+            })
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': profiles,
+            'name': f'{self.symbol} pipeline run',
+            'exporter': 'src.pipeline.profiler'
+        }
+
+    def write(self, output_dir: Path, top_n: int = 20) -> Path:
+        """Write collapsed stacks, speedscope JSON and a hot-function report."""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        report = []
+        for task_name, stacks in self.samples.items():
+            with open(output_dir / f'{task_name}.collapsed', 'w') as f:
+                f.write('\n'.join(self.collapsed(task_name)) + '\n')
+
+            total = sum(stacks.values())
+            report.append(
+                f"== {self.symbol}/{task_name}: {total} samples "
+                f"(~{total * self.interval:.2f}s at {self.interval * 1000:.0f}ms interval)"
+            )
+            report.append(f"{'self %':>8} {'total %':>8}  function")
+            for label, self_count, total_count in self.hot_functions(task_name, top_n):
+                report.append(
+                    f"{100 * self_count / total:>7.1f}% {100 * total_count / total:>7.1f}%  {label}"
+                )
+            report.append('')
+
+        with open(output_dir / 'hot_functions.txt', 'w') as f:
+            f.write('\n'.join(report))
+        with open(output_dir / 'profile.speedscope.json', 'w') as f:
+            json.dump(self.speedscope(), f)
+
+        self.logger.info(f"Profile written to {output_dir}")
+        return output_dir
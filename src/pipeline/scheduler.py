@@ -5,6 +5,8 @@ import logging
 import networkx as nx
 from typing import Dict, List, Optional, Callable, Any
 from datetime import datetime
+from .checkpoint import CheckpointStore, TaskStatus
+from .profiler import SamplingProfiler
 
 class Priority(Enum):
     HIGH = 0
@@ -25,12 +27,20 @@ class PipelineTask:
         return self.priority.value < other.priority.value
 
 class DataPipelineScheduler:
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Optional[CheckpointStore] = None,
+        profiler: Optional[SamplingProfiler] = None
+    ):
         self.tasks: Dict[str, PipelineTask] = {}
         self.graph = nx.DiGraph()
         self.results_cache: Dict[str, Any] = {}
+        self.failed_tasks: Dict[str, str] = {}
         self.logger = logging.getLogger(__name__)
         self.config = config
+        self.checkpoint = checkpoint
+        self.profiler = profiler
 
     def add_task(self, task: PipelineTask):
         """Add a task with priority to the scheduler."""
@@ -85,6 +95,37 @@ class DataPipelineScheduler:
         
         raise Exception(f"Task {task_name} failed after {task.retries} attempts")
 
+    async def _run_task(self, task_name: str) -> Any:
+        """Execute a task, attributing profiler samples to it if profiling."""
+        if not self.profiler:
+            return await self.execute_task(task_name)
+        with self.profiler.task(task_name, self.tasks[task_name].function):
+            return await self.execute_task(task_name)
+
+    def _restore_or_skip(self, task_name: str) -> bool:
+        """Return True if the task still needs to run in this pass."""
+        if task_name in self.failed_tasks:
+            return False
+        if self.checkpoint and self.checkpoint.status(task_name) == TaskStatus.COMPLETED:
+            self.results_cache[task_name] = self.checkpoint.load_result(task_name)
+            self.logger.info(f"Restored {task_name} from checkpoint {self.checkpoint.run_id}")
+            return False
+        return True
+
+    def _mark_failed(self, task_name: str, error: Exception):
+        """Mark a task and its downstream subgraph as failed."""
+        self.failed_tasks[task_name] = str(error)
+        if self.checkpoint:
+            self.checkpoint.mark_failed(task_name, str(error))
+        
+        for downstream in nx.descendants(self.graph, task_name):
+            if downstream in self.failed_tasks:
+                continue
+            self.failed_tasks[downstream] = f"Upstream task {task_name} failed"
+            if self.checkpoint:
+                self.checkpoint.mark_upstream_failed(downstream, task_name)
+            self.logger.warning(f"Skipping {downstream}: upstream task {task_name} failed")
+
     async def run(self):
         """Execute tasks in priority order within dependency constraints."""
         try:
@@ -116,10 +157,24 @@ class DataPipelineScheduler:
                 if layer:
                     priority_layers.append(layer)
             
-            # Execute tasks layer by layer
+            # Execute tasks layer by layer; a failure only stops its downstream tasks
             for layer in priority_layers:
-                tasks = [self.execute_task(task_name) for task_name in layer]
-                await asyncio.gather(*tasks)
+                runnable = [task_name for task_name in layer if self._restore_or_skip(task_name)]
+                tasks = [self._run_task(task_name) for task_name in runnable]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                for task_name, result in zip(runnable, results):
+                    if isinstance(result, Exception):
+                        self._mark_failed(task_name, result)
+                    elif isinstance(result, BaseException):
+                        raise result
+                    elif self.checkpoint:
+                        await asyncio.to_thread(self.checkpoint.save_result, task_name, result)
+            
+            if self.failed_tasks:
+                self.logger.error(f"Pipeline finished with failed tasks: {', '.join(self.failed_tasks)}")
+                if self.checkpoint:
+                    self.logger.error(f"Resume with: python main.py --resume {self.checkpoint.run_id}")
             
             return self.results_cache
             
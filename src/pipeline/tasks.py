@@ -6,6 +6,8 @@ from typing import Dict, Any, List
 import asyncio
 from datetime import datetime
 from .scheduler import PipelineTask, Priority
+from .alerts import AlertEngine
+from .dataplane import publish_frame
 from .utils import get_data_path
 from .utils import setup_logger, get_data_path
 import aiofiles
@@ -142,6 +144,11 @@ async def save_analysis(config: Dict[str, Any], dep_results: Dict[str, Any]) ->
         logger.info(f"Saving analysis data to: {data_path}")
         await asyncio.to_thread(df.to_csv, data_path)
         
+        # Memory-mapped copy for the API workers
+        dataplane_dir = get_data_path(config, 'dataplane')
+        logger.info(f"Publishing analysis data to: {dataplane_dir}")
+        await asyncio.to_thread(publish_frame, df, dataplane_dir)
+        
         # Latest metrics calculation
         latest_metrics = {
             'last_price': float(df['Close'].iloc[-1]),
@@ -172,6 +179,42 @@ async def save_analysis(config: Dict[str, Any], dep_results: Dict[str, Any]) ->
         logger.exception("Full exception details:")
         raise
 
+def evaluate_alerts(config: Dict[str, Any], dep_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Evaluate alert rules on bars appended since the previous run."""
+    df = dep_results['transform']
+    symbol = config['data']['symbol']
+    state_path = get_data_path(config, config['alerts'].get('state_file', 'alert_state.json'))
+    engine = AlertEngine.from_config(config)
+
+    last_timestamp = None
+    if state_path.exists():
+        with open(state_path) as f:
+            state = json.load(f)
+        if engine.load_state(state['engine']):
+            last_timestamp = pd.Timestamp(state['last_timestamp'])
+
+    if last_timestamp is None:
+        # No usable state: start from the latest bar instead of replaying history
+        if len(df) > 1:
+            engine.prime(df.iloc[[-2]].set_axis([symbol]))
+        new_bars = df.iloc[-1:]
+    else:
+        new_bars = df.loc[df.index > last_timestamp]
+
+    alerts = []
+    for timestamp in new_bars.index:
+        bar = new_bars.loc[[timestamp]].set_axis([symbol])
+        alerts.extend(engine.evaluate(bar, timestamp=timestamp))
+
+    with open(state_path, 'w') as f:
+        json.dump({
+            'last_timestamp': str(df.index[-1]),
+            'engine': engine.state_dict()
+        }, f)
+
+    logger.info(f"Evaluated {len(new_bars)} new bars, {len(alerts)} alerts fired")
+    return {'bars_evaluated': len(new_bars), 'alerts': alerts}
+
 def create_pipeline_tasks(config: Dict[str, Any]) -> List[PipelineTask]:
     """Create all pipeline tasks with their configurations."""
     tasks = [
@@ -199,6 +242,13 @@ def create_pipeline_tasks(config: Dict[str, Any]) -> List[PipelineTask]:
             dependencies=["transform", "validate"]
         )
     ]
+    if config.get('alerts', {}).get('enabled', False):
+        tasks.append(PipelineTask(
+            name="alerts",
+            function=evaluate_alerts,
+            priority=Priority[config['pipeline']['priorities'].get('alerts', 'LOW')],
+            dependencies=["transform"]
+        ))
     return tasks
 
 # Make create_pipeline_tasks available for import